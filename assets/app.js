@@ -5,7 +5,7 @@ const COUNTRY_CITIES = {
   'Thailand': [ { city: 'Bangkok', iata: 'BKK' }, { city: 'Phuket', iata: 'HKT' }, { city: 'Chiang Mai', iata: 'CNX' }, { city: 'Krabi', iata: 'KBV' } ]
 };
 
-const state = { raw: [], filtered: [], chart: null };
+const state = { raw: [], monthly: null, filtered: [], chart: null };
 
 function populateCities(){
   const c = document.getElementById('countrySelect').value;
@@ -18,18 +18,29 @@ function populateCities(){
   });
 }
 
+const FETCH_TIMEOUT_MS = 15000;
+
+async function loadJSON(url){
+  const res = await fetch(url, {cache:'no-store', signal: AbortSignal.timeout(FETCH_TIMEOUT_MS)});
+  if (!res.ok) throw new Error(`Failed to load ${url}: ${res.status}`);
+  return res.json();
+}
+
 async function loadData(){
-  try{
-    const res = await fetch('data/sample_data.json', {cache:'no-store'});
-    state.raw = await res.json();
-  }catch(e){ state.raw = []; }
+  try{ state.raw = await loadJSON('data/sample_data.json'); }
+  catch(e){ console.warn(e); state.raw = []; }
   document.getElementById('lastLoaded').textContent = new Date().toLocaleString('nl-NL');
 }
 
+async function loadMonthly(){
+  try{ state.monthly = await loadJSON('data/monthly_lowest.json'); }
+  catch(e){ console.warn(e); state.monthly = null; }
+}
+
 document.addEventListener('DOMContentLoaded', async () => {
   document.getElementById('countrySelect').addEventListener('change', populateCities);
   populateCities();
-  await loadData();
+  await Promise.all([loadData(), loadMonthly()]);
 
   document.getElementById('filterForm').addEventListener('submit', (e)=>{ e.preventDefault(); runAnalysis(); });
   runAnalysis();
@@ -45,14 +56,13 @@ function runAnalysis(){
   const exclude = (document.getElementById('excludeAirlines').value||'').split(',').map(s=>s.trim().toLowerCase()).filter(Boolean);
   const dest = document.getElementById('citySelect').value;
 
-  const start = new Date(startDate);
-  const endWindow = new Date('2026-08-26');
+  const endWindow = '2026-08-26';
 
   let rows = state.raw.filter(r => r.destination_iata === dest);
   rows = rows.filter(r => (useAMS && r.origin==='AMS') || (useEIN && r.origin==='EIN'));
   rows = rows.filter(r => {
-    const out = new Date(r.outbound_date);
-    if (out < start || out > endWindow) return false;
+    const out = r.outbound_date;
+    if (out < startDate || out > endWindow) return false;
     const diff = r.trip_length_days - tripLength; return Math.abs(diff) <= 2;
   });
   rows = rows.filter(r => (maxStops===3?true:r.stops<=maxStops) && r.max_layover_hours <= maxLayover);
@@ -90,21 +100,23 @@ function buildAirlineTable(rows){
 
 function buildItineraryTable(rows){
   const body = document.querySelector('#itineraryTable tbody'); body.innerHTML = '';
-  const byDate = groupBy(rows, 'outbound_date');
-  const best = Object.values(byDate).map(arr => arr.sort((a,b)=>a.price_eur-b.price_eur)[0]).sort((a,b)=> new Date(a.outbound_date) - new Date(b.outbound_date));
+  const byDate = {};
+  for (const r of rows){ const cur = byDate[r.outbound_date]; if (!cur || r.price_eur < cur.price_eur) byDate[r.outbound_date] = r; }
+  const best = Object.values(byDate).sort((a,b)=> a.outbound_date < b.outbound_date ? -1 : a.outbound_date > b.outbound_date ? 1 : 0);
   for (const r of best){ const tr = document.createElement('tr'); tr.innerHTML = `<td>${r.outbound_date} → ${r.return_date}</td><td>${r.origin} → ${r.destination_iata}</td><td>${r.airline||''}</td><td>${r.stops}</td><td>${r.max_layover_hours}</td><td>€ ${r.price_eur}</td>`; body.appendChild(tr); }
 }
 
-async function buildCalendarChart(origin, dest){
+const MONTHS = ["Jan","Feb","Mrt","Apr","Mei","Jun","Jul","Aug","Sep","Okt","Nov","Dec"];
+const MONTH_KEYS = MONTHS.map((_,i)=> String(i+1).padStart(2,'0'));
+const CAL_LABELS = MONTHS.flatMap(m => [m+"‑W1", m+"‑W2", m+"‑W3", m+"‑W4"]);
+
+function buildCalendarChart(origin, dest){
   try{
-    const res = await fetch('data/monthly_lowest.json', {cache:'no-store'});
-    const all = await res.json();
+    const all = state.monthly;
     const key = `${origin}-${dest}`;
-    const months = ["Jan","Feb","Mrt","Apr","Mei","Jun","Jul","Aug","Sep","Okt","Nov","Dec"];
-    const labels = months.flatMap(m => [m+"‑W1", m+"‑W2", m+"‑W3", m+"‑W4"]);
     const nowY = '2026', prevY = '2025';
 
-    const getSeries = (y)=> months.flatMap((_,i)=> (all?.[key]?.[y]?.[String(i+1).padStart(2,'0')] || [null,null,null,null]));
+    const getSeries = (y)=> MONTH_KEYS.flatMap(mk => (all?.[key]?.[y]?.[mk] || [null,null,null,null]));
     const sNow  = getSeries(nowY);
     const sPrev = (all?.[key]?.[prevY]) ? getSeries(prevY) : null;
 
@@ -113,6 +125,6 @@ async function buildCalendarChart(origin, dest){
     const datasets = [ { label:`${key} – ${nowY}`, data:sNow, borderColor:'#4ad395', backgroundColor:'rgba(74,211,149,.18)', tension:.25, pointRadius:0 } ];
     if (sPrev) datasets.push({ label:`${key} – ${prevY}`, data:sPrev, borderColor:'#5db2ff', backgroundColor:'rgba(93,178,255,.12)', tension:.25, pointRadius:0 });
 
-    window._calChart = new Chart(ctx, { type:'line', data:{ labels, datasets }, options:{ scales:{ y:{ title:{display:true, text:'Prijs (€)'} } }, plugins:{ legend:{display:true} } } });
-  }catch(e){ /* ignore */ }
+    window._calChart = new Chart(ctx, { type:'line', data:{ labels: CAL_LABELS, datasets }, options:{ scales:{ y:{ title:{display:true, text:'Prijs (€)'} } }, plugins:{ legend:{display:true} } } });
+  }catch(e){ console.warn('Failed to build calendar chart', e); }
 }